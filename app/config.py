@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -6,8 +7,27 @@ class Settings(BaseSettings):
     LOG_DIR: str = "logs"
     MAX_ROUNDS: int = 8
     MODEL_NAME: str = "llama-3.3-70b-versatile"
+    LLM_BACKEND: str = "groq"    # 'stub' = offline canned replies (load testing)
+    STUB_LATENCY: float = 0.2    # seconds per stub call
     LOG_LEVEL: str = "INFO"  # <--- This line MUST be here
 
+    # --- Model Routing ---
+    # JSON maps, e.g. NODE_MODELS='{"agent": "llama-3.1-8b-instant", "judge": "llama-3.3-70b-versatile"}'
+    NODE_MODELS: Dict[str, str] = {}       # 'agent' / 'judge' -> model (defaults to MODEL_NAME)
+    PERSONA_MODELS: Dict[str, str] = {}    # persona name -> model, overrides NODE_MODELS for agent turns
+    MODEL_TIMEOUTS: Dict[str, float] = {}  # model -> request timeout in seconds
+    DEFAULT_TIMEOUT: float = 30.0
+    # Client retries per attempt. While another model is left to try, retries are off so the
+    # timeout bounds each attempt and the router falls back instead; the last (or only)
+    # model keeps retries so a transient 429/5xx doesn't end the debate.
+    MODEL_MAX_RETRIES: int = 0
+    LAST_MODEL_MAX_RETRIES: int = 2        # langchain-groq default
+    FALLBACK_MODEL: str = "llama-3.1-8b-instant"  # empty string disables fallback
+    FALLBACK_P95_LATENCY: float = 15.0     # seconds
+    FALLBACK_ERROR_RATE: float = 0.25
+    HEALTH_WINDOW: float = 120.0           # seconds of history behind p95 / error rate
+    HEALTH_MIN_SAMPLES: int = 5
+
     class Config:
         env_file = ".env"
         extra = "ignore"     # <--- This handles any other surprise variables
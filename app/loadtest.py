@@ -0,0 +1,286 @@
+import os
+import sys
+import math
+import json
+import time
+import random
+import asyncio
+import argparse
+import shutil
+import tempfile
+import subprocess
+import httpx
+from app.prompts import PERSONALITY_PROMPTS
+
+# Load generator for the SSE server.
+#
+# Offline (spawns the server with the stub model, no Groq calls):
+#   python -m app.loadtest --spawn --debates 50 --rate 5
+# Against a running server:
+#   python -m app.loadtest --url http://localhost:8000 --server-pid <pid>
+
+DEFAULT_TOPICS = [
+    "Is AI a threat to humanity?",
+    "Should remote work be the default?",
+    "Is nuclear power the answer to climate change?",
+    "Should social media be regulated like tobacco?",
+]
+
+
+def percentile(values: list, q: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    # Nearest-rank percentile
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def summarize(values: list) -> dict:
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+def read_rss_mb(pid: int):
+    """Resident memory of a process in MB (Linux /proc), None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+async def sample_rss(pid: int, interval: float, samples: list, started: float):
+    while True:
+        rss = read_rss_mb(pid)
+        if rss is not None:
+            samples.append((round(time.monotonic() - started, 2), round(rss, 1)))
+        await asyncio.sleep(interval)
+
+
+async def run_debate(client: httpx.AsyncClient, url: str, params: dict, timeout: float) -> dict:
+    """Opens one /start_debate stream and records event timings."""
+    result = {"status": "disconnect", "ttfe": None, "gaps": [], "completion": None, "events": 0}
+    started = time.monotonic()
+    last_event = None
+
+    async def consume():
+        nonlocal last_event
+        async with client.stream("GET", f"{url}/start_debate", params=params) as resp:
+            if resp.status_code != 200:
+                result["status"] = "error"
+                result["error"] = f"HTTP {resp.status_code}"
+                return
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                now = time.monotonic()
+
+                if line[6:] == "[DONE]":
+                    result["status"] = "ok"
+                    result["completion"] = now - started
+                    return
+
+                result["events"] += 1
+                if last_event is None:
+                    result["ttfe"] = now - started
+                else:
+                    result["gaps"].append(now - last_event)
+                last_event = now
+
+    try:
+        await asyncio.wait_for(consume(), timeout)
+    except asyncio.TimeoutError:
+        result["status"] = "error"
+        result["error"] = "timeout"
+    except Exception as e:
+        # httpx.HTTPError, httpx.StreamError or anything else from one stream must not abort the run.
+        # Connection dropped mid-stream counts as a disconnect, failing to connect as an error
+        result["status"] = "disconnect" if result["events"] else "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+async def run_load(args) -> dict:
+    rng = random.Random(args.seed)
+    personas = args.personas or list(PERSONALITY_PROMPTS)
+    topics = args.topics or DEFAULT_TOPICS
+
+    rss_samples = []
+    started = time.monotonic()
+    sampler = None
+    if args.server_pid:
+        sampler = asyncio.create_task(sample_rss(args.server_pid, args.rss_interval, rss_samples, started))
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(timeout=httpx.Timeout(None, connect=10.0), limits=limits) as client:
+        tasks = []
+        for i in range(args.debates):
+            params = {
+                "topic": rng.choice(topics),
+                "agent_a": rng.choice(personas),
+                "agent_b": rng.choice(personas),
+                "rounds": args.rounds,
+            }
+            tasks.append(asyncio.create_task(run_debate(client, args.url, params, args.timeout)))
+            # Poisson arrivals at --rate debates/second (0 = open everything at once),
+            # no wait after the last one so it doesn't count towards wall time
+            if args.rate > 0 and i < args.debates - 1:
+                await asyncio.sleep(rng.expovariate(args.rate))
+        results = await asyncio.gather(*tasks)
+
+    elapsed = time.monotonic() - started
+    if sampler:
+        sampler.cancel()
+
+    ok = [r for r in results if r["status"] == "ok"]
+    errors = [r for r in results if r["status"] == "error"]
+    rss_values = [s[1] for s in rss_samples]
+
+    return {
+        "debates": len(results),
+        "completed": len(ok),
+        "error_rate": len(errors) / len(results) if results else 0.0,
+        "disconnect_rate": sum(1 for r in results if r["status"] == "disconnect") / len(results) if results else 0.0,
+        "wall_time": elapsed,
+        "throughput": len(ok) / elapsed if elapsed else 0.0,  # completed debates / second
+        "ttfe": summarize([r["ttfe"] for r in results if r["ttfe"] is not None]),
+        "inter_event_gap": summarize([g for r in results for g in r["gaps"]]),
+        "completion": summarize([r["completion"] for r in ok]),
+        "rss_mb": {
+            "start": rss_values[0] if rss_values else None,
+            "peak": max(rss_values) if rss_values else None,
+            "end": rss_values[-1] if rss_values else None,
+            "samples": rss_samples,
+        },
+        "errors": sorted({r["error"] for r in results if r.get("error")}),
+    }
+
+
+def print_report(report: dict):
+    def fmt(value, unit="s"):
+        return "-" if value is None else f"{value:.3f}{unit}"
+
+    print("\n==========================================")
+    print("            LOAD TEST REPORT              ")
+    print("==========================================")
+    print(f"Debates:        {report['completed']}/{report['debates']} completed in {report['wall_time']:.1f}s")
+    print(f"Throughput:     {report['throughput']:.2f} debates/s")
+    print(f"Error rate:     {report['error_rate']:.1%}")
+    print(f"Disconnects:    {report['disconnect_rate']:.1%}")
+    for key, label in [("ttfe", "First event"), ("inter_event_gap", "Event gap"), ("completion", "Completion")]:
+        stats = report[key]
+        print(f"{label + ':':<16}p50 {fmt(stats['p50'])}  p95 {fmt(stats['p95'])}  p99 {fmt(stats['p99'])}  max {fmt(stats['max'])}")
+    rss = report["rss_mb"]
+    print(f"Server RSS:     start {fmt(rss['start'], 'MB')}  peak {fmt(rss['peak'], 'MB')}  end {fmt(rss['end'], 'MB')}")
+    for error in report["errors"]:
+        print(f"  ! {error}")
+    print("=" * 42)
+
+
+def spawn_server(args, workdir: str):
+    """Starts uvicorn with the stub model in a scratch directory so logs don't pile up in the repo."""
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(
+        os.environ,
+        PYTHONPATH=repo_root,
+        LLM_BACKEND="stub",
+        STUB_LATENCY=str(args.stub_latency),
+        GROQ_API_KEY=os.environ.get("GROQ_API_KEY", "offline"),
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.server:app", "--host", "127.0.0.1", "--port", str(args.port), "--log-level", "warning"],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}")
+        try:
+            if httpx.get(f"{args.url}/health", timeout=1.0).status_code == 200:
+                print(f"[INFO] Stub server running (pid {proc.pid}, scratch dir {workdir}, removed on exit)")
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+
+    proc.terminate()
+    proc.wait()
+    raise RuntimeError("Server did not become healthy within 30s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the debate SSE server")
+    parser.add_argument("--url", type=str, default=None, help="Server URL (default http://127.0.0.1:<port>, not allowed with --spawn)")
+    parser.add_argument("--debates", type=int, default=20, help="Total debates to open")
+    parser.add_argument("--rate", type=float, default=0.0, help="Arrival rate in debates/second (0 = all at once)")
+    parser.add_argument("--rounds", type=int, default=2, help="Rounds per debate")
+    parser.add_argument("--topics", nargs="+", help="Topics to sample from")
+    parser.add_argument("--personas", nargs="+", help="Personas to sample from (default: all)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-debate timeout in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for topic/persona/arrival mix")
+    parser.add_argument("--spawn", action="store_true", help="Start a local server with the offline stub model")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --spawn")
+    parser.add_argument("--stub-latency", type=float, default=0.2, help="Seconds per stub LLM call with --spawn")
+    parser.add_argument("--server-pid", type=int, help="Server pid to sample RSS from (implied by --spawn)")
+    parser.add_argument("--rss-interval", type=float, default=0.5, help="Seconds between RSS samples")
+    parser.add_argument("--json", type=str, help="Write the full report to this file")
+    parser.add_argument("--max-p95", type=float, help="Fail if p95 completion time exceeds this (seconds)")
+    parser.add_argument("--min-throughput", type=float, help="Fail if throughput is below this (debates/s)")
+    parser.add_argument("--max-error-rate", type=float, help="Fail if error + disconnect rate exceeds this (0-1)")
+    args = parser.parse_args()
+
+    if args.spawn and args.url:
+        parser.error("--url cannot be combined with --spawn; use --port to choose the spawned server's port")
+    args.url = (args.url or f"http://127.0.0.1:{args.port}").rstrip("/")
+
+    server = None
+    workdir = tempfile.mkdtemp(prefix="debate_loadtest_") if args.spawn else None
+    try:
+        if args.spawn:
+            server = spawn_server(args, workdir)
+            args.server_pid = server.pid
+        report = asyncio.run(run_load(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Full report saved to: {args.json}")
+
+    # --- Release Gates ---
+    failures = []
+    p95 = report["completion"]["p95"]
+    if args.max_p95 is not None and (p95 is None or p95 > args.max_p95):
+        failures.append(f"p95 completion {p95} > {args.max_p95}s")
+    if args.min_throughput is not None and report["throughput"] < args.min_throughput:
+        failures.append(f"throughput {report['throughput']:.2f} < {args.min_throughput} debates/s")
+    failed_rate = report["error_rate"] + report["disconnect_rate"]
+    if args.max_error_rate is not None and failed_rate > args.max_error_rate:
+        failures.append(f"error rate {failed_rate:.1%} > {args.max_error_rate:.1%}")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
 from app.state import DebateState
 from app.config import settings
 from app.prompts import get_system_prompt
+from app.routing import ModelRouter
 import json
 import re
 import ast
@@ -55,11 +55,8 @@ def check_coherence(text, topic):
     return True, "Coherent"
 
 # --- LLM SETUP ---
-llm = ChatGroq(
-    temperature=0.6, # We will make this configurable later for determinism
-    model_name=settings.MODEL_NAME,
-    groq_api_key=settings.GROQ_API_KEY
-)
+# Model per node/persona comes from settings (see app/routing.py)
+router = ModelRouter()
 
 def agent_node(state: DebateState, agent_name: str, persona: str):
     messages = state['messages']
@@ -75,13 +72,17 @@ def agent_node(state: DebateState, agent_name: str, persona: str):
     history_text = "\n".join([f"{m.type}: {m.content}" for m in messages])
 
     prompt = ChatPromptTemplate.from_messages([
-        ("system", system_prompt_text),
-        ("human", f"Current Debate History:\n{history_text}\n\nYour turn to argue:")
+        ("system", "{system_prompt}"),
+        ("human", "Current Debate History:\n{history}\n\nYour turn to argue:")
     ])
     
-    # Generate Response
-    chain = prompt | llm
-    response = chain.invoke({})
+    # Generate Response (text passed as variables so braces in topics/replies aren't parsed)
+    response, model, latency = router.invoke(
+        prompt,
+        {"system_prompt": system_prompt_text, "history": history_text},
+        node="agent",
+        persona=selected_persona
+    )
     content = response.content
     
     # --- 3. REPETITION & COHERENCE CHECKS ---
@@ -101,12 +102,15 @@ def agent_node(state: DebateState, agent_name: str, persona: str):
     log_event("Turn_Execution", {
         "agent": agent_name,
         "round": state["round_count"],
-        "content_length": len(content)
+        "content_length": len(content),
+        "model": model,
+        "latency": round(latency, 3)
     })
 
     return {
         "messages": [response],
-        "round_count": state["round_count"] + 1
+        "round_count": state["round_count"] + 1,
+        "model": model
     }
 
 import re # Ensure regex is imported
@@ -153,10 +157,11 @@ def judge_node(state: DebateState):
         ("human", f"Topic: {{topic}}\n\nHistory:\n{{history}}")
     ])
     
-    chain = prompt | llm
-    
+    model = None
+
     try:
-        response = chain.invoke({"topic": topic, "history": history_text})
+        response, model, latency = router.invoke(prompt, {"topic": topic, "history": history_text}, node="judge")
+        log_event("Judge_Execution", {"model": model, "latency": round(latency, 3)})
         content = response.content.strip() + "\n<END>"
         print(f"\n[DEBUG] RAW LLM OUTPUT:\n{content}\n") 
         
@@ -240,4 +245,4 @@ def judge_node(state: DebateState):
             "weaknesses": { "Agent A": [], "Agent B": [] }
         }
         
-    return { "winner": formatted_data }
\ No newline at end of file
+    return { "winner": formatted_data, "model": model }
\ No newline at end of file
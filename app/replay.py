@@ -0,0 +1,149 @@
+import json
+import re
+import asyncio
+
+# Saved logs are read in chunks of this size, never loaded whole
+CHUNK_SIZE = 64 * 1024
+
+# Gap used for logs saved before per-message timing was recorded
+# (matches the pacing of the live /start_debate stream)
+DEFAULT_GAP = 0.5
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"\s*")
+_delimiter = re.compile(r"[\s,\]}]")
+
+
+class _LogReader:
+    """Minimal pull parser over a file of JSON text, buffering one chunk at a time."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        # Drop everything already consumed so the buffer stays small
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def accept(self, char):
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, char):
+        if not self.accept(char):
+            raise ValueError(f"Malformed debate log: expected '{char}' near offset {self.pos}")
+
+    def value(self):
+        # Bare literals (numbers, true/false/null) are not self-delimiting,
+        # so make sure the whole token is buffered before decoding it
+        if self.peek() not in "{[\"":
+            while not _delimiter.search(self.buf, self.pos) and self._fill():
+                pass
+
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self.pos = end
+            return obj
+
+
+def iter_log(path: str):
+    """
+    Yields (key, value) pairs from a saved debate log.
+    Entries of the 'messages' array are yielded one at a time as ("message", item).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _LogReader(f)
+        reader.expect("{")
+        if not reader.accept("}"):
+            while True:
+                key = reader.value()
+                reader.expect(":")
+
+                if key == "messages" and reader.accept("["):
+                    if not reader.accept("]"):
+                        while True:
+                            yield "message", reader.value()
+                            if not reader.accept(","):
+                                break
+                        reader.expect("]")
+                else:
+                    yield key, reader.value()
+
+                if not reader.accept(","):
+                    break
+            reader.expect("}")
+
+        # A saved debate is a single JSON object; trailing data means some other
+        # file, e.g. the JSON-lines CLI logs that share the log directory
+        if reader.peek():
+            raise ValueError("Malformed debate log: unexpected data after the closing '}'")
+
+
+async def replay_events(path: str, speed: float = None, debate_id: str = None):
+    """
+    Yields the same event payloads /start_debate streams, read from a saved log.
+    speed=None replays instantly, otherwise the recorded gaps are divided by speed.
+    """
+    winner = None
+    duration = None
+    judge_model = None
+    clock = 0.0
+
+    async def wait_until(elapsed):
+        nonlocal clock
+        if speed and elapsed > clock:
+            await asyncio.sleep((elapsed - clock) / speed)
+        clock = max(clock, elapsed)
+
+    for key, value in iter_log(path):
+        if key == "message":
+            if not isinstance(value, dict):
+                raise ValueError(f"Malformed debate log: message is {type(value).__name__}, expected object")
+            elapsed = value.get("elapsed", clock + DEFAULT_GAP)
+            if not isinstance(elapsed, (int, float)):
+                raise ValueError("Malformed debate log: message elapsed must be a number")
+            await wait_until(elapsed)
+            yield {
+                "type": "message",
+                "sender": value.get("sender"),
+                "content": value.get("content"),
+                "model": value.get("model")
+            }
+        elif key == "winner":
+            winner = value
+        elif key == "duration":
+            if value is not None and not isinstance(value, (int, float)):
+                raise ValueError("Malformed debate log: duration must be a number")
+            duration = value
+        elif key == "judge_model":
+            judge_model = value
+
+    if winner:
+        await wait_until(duration if duration is not None else clock + DEFAULT_GAP)
+        yield {
+            "type": "verdict",
+            "winner": winner,
+            "model": judge_model,
+            "id": debate_id
+        }
@@ -0,0 +1,124 @@
+import math
+import time
+import logging
+from collections import deque
+from langchain_groq import ChatGroq
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelHealth:
+    """Rolling latency / error window for one model."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self.samples = deque()  # (finished_at, latency_seconds, ok)
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.window
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+
+    def record(self, latency: float, ok: bool):
+        self.samples.append((time.monotonic(), latency, ok))
+        self._prune()
+
+    def p95(self) -> float:
+        self._prune()
+        latencies = sorted(s[1] for s in self.samples)
+        if not latencies:
+            return 0.0
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def error_rate(self) -> float:
+        self._prune()
+        if not self.samples:
+            return 0.0
+        return sum(1 for s in self.samples if not s[2]) / len(self.samples)
+
+    def is_degraded(self) -> bool:
+        # Old samples expire, so a degraded model is retried once its window clears
+        self._prune()
+        if len(self.samples) < settings.HEALTH_MIN_SAMPLES:
+            return False
+        return (
+            self.p95() > settings.FALLBACK_P95_LATENCY
+            or self.error_rate() > settings.FALLBACK_ERROR_RATE
+        )
+
+
+class ModelRouter:
+    """
+    Picks a model per node ('agent' / 'judge') and persona, and falls back to
+    settings.FALLBACK_MODEL when the chosen model is slow, failing or times out.
+    """
+
+    def __init__(self):
+        self.llms = {}
+        self.health = {}
+
+    def get_llm(self, model: str, max_retries: int = 0):
+        key = (model, max_retries)
+        if key in self.llms:
+            return self.llms[key]
+
+        if settings.LLM_BACKEND == "stub":
+            # Offline stand-in, see app/stub_llm.py
+            from app.stub_llm import StubChatModel
+            self.llms[key] = StubChatModel(model_name=model, latency=settings.STUB_LATENCY)
+        else:
+            self.llms[key] = ChatGroq(
+                temperature=0.6, # We will make this configurable later for determinism
+                model_name=model,
+                groq_api_key=settings.GROQ_API_KEY,
+                timeout=settings.MODEL_TIMEOUTS.get(model, settings.DEFAULT_TIMEOUT),
+                max_retries=max_retries
+            )
+        return self.llms[key]
+
+    def get_health(self, model: str) -> ModelHealth:
+        if model not in self.health:
+            self.health[model] = ModelHealth(settings.HEALTH_WINDOW)
+        return self.health[model]
+
+    def select(self, node: str, persona: str = None) -> str:
+        """Configured model for this node: persona override, then node override, then MODEL_NAME."""
+        if persona and persona in settings.PERSONA_MODELS:
+            return settings.PERSONA_MODELS[persona]
+        return settings.NODE_MODELS.get(node, settings.MODEL_NAME)
+
+    def candidates(self, node: str, persona: str = None) -> list:
+        primary = self.select(node, persona)
+        fallback = settings.FALLBACK_MODEL
+        if not fallback or fallback == primary:
+            return [primary]
+        # Only reorder when the fallback is itself healthy
+        if self.get_health(primary).is_degraded() and not self.get_health(fallback).is_degraded():
+            logger.warning(f"Model {primary} degraded, routing {node} to {fallback}")
+            return [fallback, primary]
+        return [primary, fallback]
+
+    def invoke(self, prompt, inputs: dict, node: str, persona: str = None):
+        """Runs prompt | llm on the routed model. Returns (response, model, latency_seconds)."""
+        # Format once, outside the retry loop: bad input is not a model failure
+        messages = prompt.invoke(inputs)
+        models = self.candidates(node, persona)
+
+        for i, model in enumerate(models):
+            is_last = i == len(models) - 1
+            retries = settings.LAST_MODEL_MAX_RETRIES if is_last else settings.MODEL_MAX_RETRIES
+            started = time.monotonic()
+            try:
+                response = self.get_llm(model, retries).invoke(messages)
+            except Exception as e:
+                latency = time.monotonic() - started
+                self.get_health(model).record(latency, ok=False)
+                if is_last:
+                    raise
+                logger.warning(f"Model {model} failed for {node} ({e}), falling back to {models[i + 1]}")
+                continue
+
+            latency = time.monotonic() - started
+            self.get_health(model).record(latency, ok=True)
+            return response, model, latency
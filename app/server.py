@@ -1,11 +1,16 @@
 import os
 import json
 import asyncio
+import re
+import time
+import uuid
 import datetime
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from app.graph import app as debate_graph
+from app.config import settings
+from app.replay import replay_events
 
 app = FastAPI()
 
@@ -16,27 +21,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Replay ids are the suffix of the log filename, e.g. 20250101_120000_1a2b3c4d
+LOG_ID_PATTERN = re.compile(r"[\w-]+")
+
+def new_debate_id() -> str:
+    """Timestamp plus a random suffix, so debates finishing in the same second don't collide."""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{timestamp}_{uuid.uuid4().hex[:8]}"
+
+def sse(payload) -> str:
+    """Formats one Server-Sent Event, shared by live and replayed debates."""
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    return f"data: {data}\n\n"
+
 # --- HELPER: Save Logs to File ---
-def save_debate_log(topic: str, messages: list, winner: dict):
+def save_debate_log(topic: str, messages: list, winner: dict, duration: float = None, judge_model: str = None, debate_id: str = None):
     """
-    Saves the debate history and winner stats to the 'logs/' directory.
+    Saves the debate history and winner stats to settings.LOG_DIR ('logs/' by default).
+    Returns the debate id used by /replay, or None if saving failed.
     """
     try:
         # 1. Ensure 'logs' folder exists
-        log_dir = "logs"
-        os.makedirs(log_dir, exist_ok=True)
+        os.makedirs(settings.LOG_DIR, exist_ok=True)
 
-        # 2. Create Filename with Timestamp
+        # 2. Create Filename with Timestamp + Unique Suffix
+        debate_id = debate_id or new_debate_id()
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"debate_log_{timestamp}.json"
-        file_path = os.path.join(log_dir, filename)
+        filename = f"debate_log_{debate_id}.json"
+        file_path = os.path.join(settings.LOG_DIR, filename)
 
         # 3. Construct Data Structure
         log_data = {
+            "id": debate_id,
             "topic": topic,
             "timestamp": timestamp,
             "winner": winner,
-            "messages": messages  # Expecting list of dicts: {sender, content}
+            "duration": duration,  # Seconds from start to verdict, used by /replay
+            "judge_model": judge_model,
+            "messages": messages  # Expecting list of dicts: {sender, content, model, elapsed}
         }
 
         # 4. Save to File
@@ -44,9 +66,11 @@ def save_debate_log(topic: str, messages: list, winner: dict):
             json.dump(log_data, f, indent=2, ensure_ascii=False)
             
         print(f"✅ Log saved to: {file_path}")
+        return debate_id
         
     except Exception as e:
         print(f"❌ Failed to save log: {e}")
+        return None
 
 @app.get("/health")
 def health():
@@ -74,6 +98,10 @@ async def start_debate(
         # --- Track Data for Logging ---
         accumulated_messages = []
         final_winner_data = None
+        final_duration = None
+        final_judge_model = None
+        debate_id = new_debate_id()  # Sent with the verdict so clients can /replay it
+        started = time.monotonic()
 
         for event in debate_graph.stream(initial_state):
             for node_name, state_update in event.items():
@@ -87,38 +115,75 @@ async def start_debate(
                     accumulated_messages.append({
                         "sender": sender,
                         "content": last_msg.content,
-                        "type": "agent_message"
+                        "model": state_update.get("model"),
+                        "type": "agent_message",
+                        "elapsed": round(time.monotonic() - started, 3)
                     })
 
                     # Stream to Frontend
-                    data = json.dumps({
+                    yield sse({
                         "type": "message",
                         "sender": sender,
-                        "content": last_msg.content
+                        "content": last_msg.content,
+                        "model": state_update.get("model")
                     })
-                    yield f"data: {data}\n\n"
                 
                 # 2. Handle Judge Verdict
                 if node_name == "Judge":
                     # Capture the full winner object from the state update
                     winner_info = state_update.get("winner")
                     final_winner_data = winner_info
+                    final_duration = round(time.monotonic() - started, 3)
+                    final_judge_model = state_update.get("model")
 
                     # Stream to Frontend
-                    data = json.dumps({
+                    yield sse({
                         "type": "verdict",
-                        "winner": winner_info
+                        "winner": winner_info,
+                        "model": final_judge_model,
+                        "id": debate_id
                     })
-                    yield f"data: {data}\n\n"
                 
                 await asyncio.sleep(0.5)
 
         # --- SAVE LOG BEFORE FINISHING ---
         if final_winner_data:
-            save_debate_log(topic, accumulated_messages, final_winner_data)
+            save_debate_log(topic, accumulated_messages, final_winner_data, final_duration, final_judge_model, debate_id)
         else:
             print("⚠️ No winner data found to save.")
 
-        yield "data: [DONE]\n\n"
+        yield sse("[DONE]")
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+@app.get("/replay/{debate_id}")
+async def replay_debate(debate_id: str, mode: str = "instant", speed: float = 1.0):
+    """
+    Streams a saved debate with the same events as /start_debate, without any LLM calls.
+    mode: 'instant' (no delays), 'original' (recorded timing) or 'speed' (recorded timing / speed).
+    """
+    file_path = os.path.join(settings.LOG_DIR, f"debate_log_{debate_id}.json")
+    if not LOG_ID_PATTERN.fullmatch(debate_id) or not os.path.isfile(file_path):
+        raise HTTPException(status_code=404, detail=f"No saved debate '{debate_id}'")
+
+    if mode == "instant":
+        replay_speed = None
+    elif mode == "original":
+        replay_speed = 1.0
+    elif mode == "speed":
+        if speed <= 0:
+            raise HTTPException(status_code=400, detail="speed must be greater than 0")
+        replay_speed = speed
+    else:
+        raise HTTPException(status_code=400, detail="mode must be 'instant', 'original' or 'speed'")
+
+    async def event_generator():
+        try:
+            async for payload in replay_events(file_path, replay_speed, debate_id):
+                yield sse(payload)
+        except ValueError as e:
+            print(f"❌ Failed to replay {file_path}: {e}")
+
+        yield sse("[DONE]")
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
\ No newline at end of file
@@ -10,4 +10,5 @@ class DebateState(TypedDict):
     rationale: str
     agent_a_persona: str 
     agent_b_persona: str
-    max_rounds: int  
\ No newline at end of file
+    max_rounds: int
+    model: str  # Model that produced the latest update
\ No newline at end of file
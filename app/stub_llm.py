@@ -0,0 +1,65 @@
+import time
+import random
+import itertools
+from typing import Any, List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+# Offline stand-in for Groq, enabled with LLM_BACKEND=stub.
+# Used by the load tester so the server can be exercised without network or tokens.
+
+ARGUMENTS = [
+    "**Point {n}:** The evidence on {topic} clearly favours my side.\n> Over 60% of experts agree.",
+    "**Rebuttal {n}:** My opponent ignores the real cost of {topic}.\n> History repeats itself.",
+    "**Counter {n}:** Consider the long-term consequences of {topic} for ordinary people.",
+    "**Argument {n}:** The data on {topic} is unambiguous once you read past the headlines.",
+]
+
+JUDGE_REPLY = (
+    "Winner: Agent A\n"
+    "Summary: Both agents argued their positions on the topic.\n"
+    "Rationale: Agent A supported claims with more evidence.\n"
+    "Conclusion: A close debate decided on logic.\n"
+    "A_Logic: 80\n"
+    "A_Persuasion: 75\n"
+    "A_Aggression: 55\n"
+    "B_Logic: 70\n"
+    "B_Persuasion: 72\n"
+    "B_Aggression: 60\n"
+    "A_Strengths: Clear evidence || Strong structure\n"
+    "A_Weaknesses: Repetitive || Ignored counterpoints\n"
+    "B_Strengths: Good rebuttals || Emotional appeal\n"
+    "B_Weaknesses: Few statistics || Drifted off topic"
+)
+
+_counter = itertools.count(1)
+
+
+class StubChatModel(BaseChatModel):
+    model_name: str = "stub"
+    latency: float = 0.0  # Seconds to sleep per call, to mimic inference time
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+
+        system = messages[0].content if messages else ""
+        if "Debate Judge" in system:
+            text = JUDGE_REPLY
+        else:
+            topic = system.split("TOPIC: '", 1)[-1].split("'", 1)[0]
+            text = random.choice(ARGUMENTS).format(n=next(_counter), topic=topic)
+
+        message = AIMessage(content=text, response_metadata={"model_name": self.model_name})
+        return ChatResult(generations=[ChatGeneration(message=message)])
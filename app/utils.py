@@ -21,6 +21,7 @@ def log_transition(logger, step: str, state: dict):
         "timestamp": time.time(),
         "step": step,
         "round": state.get("round_count", 0),
+        "model": state.get("model"),
         "last_message": state["messages"][-1].content if state.get("messages") else None
     }
     logger.info(json.dumps(serializable_state))
\ No newline at end of file